@@ -19,33 +19,43 @@ except ImportError:
 class Base:
     """A base class."""
 
+    __slots__ = ('name',)
+
     def __init__(self, name):
         """Initialize the class."""
         self.name = name
 
     def __eq__(self, other) -> bool:
         """Check two instances are equal."""
-        return type(self) == type(other) and self.name == other.name
+        return type(self) is type(other) and self.name == other.name
 
 
 class A(Base):
     """A base class."""
 
+    __slots__ = ()
+
 
 class B(Base):
     """B base class."""
 
+    __slots__ = ()
+
 
 class C(Base):
     """C base class."""
 
+    __slots__ = ()
+
 
 class TestResolver(unittest.TestCase):
     """Tests for the resolver."""
 
-    def setUp(self) -> None:
-        """Set up the resolver class."""
-        self.resolver = Resolver([A, B, C], base=Base)
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the resolver class, shared by all tests since none of them modify it."""
+        cls.resolver = Resolver([A, B, C], base=Base)
+        cls.runner = CliRunner()
 
     def test_lookup(self):
         """Test looking up classes."""
@@ -118,18 +128,16 @@ class TestResolver(unittest.TestCase):
         self._test_cli(cli)
 
     def _test_cli(self, cli):
-        runner = CliRunner()
-
         # Test default
-        result: Result = runner.invoke(cli, [])
+        result: Result = self.runner.invoke(cli, [])
         self.assertEqual(A.__name__, result.output)
 
         # Test canonical name
-        result: Result = runner.invoke(cli, ['--opt', 'A'])
+        result: Result = self.runner.invoke(cli, ['--opt', 'A'])
         self.assertEqual(A.__name__, result.output)
 
         # Test normalizing name
-        result: Result = runner.invoke(cli, ['--opt', 'a'])
+        result: Result = self.runner.invoke(cli, ['--opt', 'a'])
         self.assertEqual(A.__name__, result.output)
 
     def test_click_option_str(self):